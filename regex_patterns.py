@@ -3,8 +3,8 @@ import re
 # Dictionary of regex patterns for identifying common dataset/database references in text
 patterns = {
     # DOI formats
-    'doi_short': r'https?\s*:\s*/\s*/\s*(?:doi\.org|dx\.doi\.org)\s*/\s*10\.\d{4,9}/[A-Za-z0-9._\-()/]+\b',  # Standard DOI link (with optional spacing)
-    'doi_long': r'\bhttps?://(?:doi\.org|dx\.doi\.org)/10\.\d{4,9}/[A-Za-z0-9._\-()/]+(?: [A-Za-z0-9._\-()/]+)\b',  # Longer DOI with potential trailing text
+    'doi_short': r'https?://(?:dx\.)?doi\.org/10\.\d{4,9}/[A-Za-z0-9._\-()/]+\b',  # Standard DOI link (spacing is closed up by clean_text)
+    'doi_long': r'\bhttps?://(?:dx\.)?doi\.org/10\.\d{4,9}/[A-Za-z0-9._\-()/]+(?: (?=[A-Za-z._\-()/]*\d)[A-Za-z0-9._\-()/]+)\b',  # DOI split by a space (the fragment after it must contain a digit)
     'doi_xml': r'\bdoi:\s*10\.\d{4,9}/[A-Za-z0-9._\-()/]+\b',  # DOI prefixed with "doi:"
 
     # BioSample / BioProject identifiers
@@ -27,7 +27,7 @@ patterns = {
     'CHEMBL': r'\bCHEMBL\d+\b',       # ChEMBL chemical compound IDs
     'IPR': r'\bIPR\d{6,}\b',          # InterPro protein families
     'PF': r'\bPF\d{5,}\b',            # Pfam protein families
-    'KEGG K Numbers': r'\bK\d{5,}\b', # KEGG orthology IDs
+    'KEGG K Numbers': r'\bK\d{5}\b',  # KEGG orthology IDs (exactly 5 digits)
     'PDB ID': r'\b[1-9](?:[a-z]{2}[a-z0-9]|[a-z][a-z0-9][a-z]|[a-z0-9][a-z]{2})\b',  # Protein Data Bank IDs
     'Short Alphanumeric ID (PDB-like)': r'\b[0-9](?:[A-Z]{2}[A-Z0-9]|[A-Z][A-Z0-9][A-Z]|[A-Z0-9][A-Z]{2})\b',  # Short structural IDs
 
@@ -55,8 +55,18 @@ patterns = {
     'KX ID': r'\bKX\d{6,}\b',          # GenBank sequence IDs
     'BX ID': r'\bBX\d+\b',             # GenBank BAC clone IDs
     'STH ID': r'\bSTH\d+\b',           # Custom/unknown reference IDs
-    'F ID': r'\bF(?=[A-Z0-9]{5,})(?=(?:.*\d){2,})(?=(?:.*[A-Z]){2,})[A-Z0-9]+\b',  # Patterned IDs starting with F
+    'F ID': r'\bF(?=[A-Z0-9]{5,}\b)(?=[A-Z]*\d[A-Z]*\d)(?=\d*[A-Z]\d*[A-Z])[A-Z0-9]+\b',  # Patterned IDs starting with F (2+ digits and 2+ letters after the F)
     'D ID': r'\bD\d{5,}\b',            # Dataset IDs starting with D
     'ERR ID (ENA Run)': r'\bERR\d+\b', # ENA sequence run IDs
     'MODEL ID': r'\bMODEL\d+\b'        # Structural model IDs
 }
+
+# Minimum context score (see DatasetReferenceExtractor.score_context) a mention needs to be kept,
+# for patterns that also match ordinary words, numbers and codes in running text
+min_context_scores = {
+    'PDB ID': 1,
+    'Short Alphanumeric ID (PDB-like)': 1,
+    'KEGG K Numbers': 1,
+    'F ID': 1,
+    'D ID': 1,
+}